@@ -2,48 +2,230 @@
 """
 Quickly adjust U.S. dollars for inflation using the Consumer Price Index (CPI)
 """
+import functools
 import logging
 import numbers
+import os
+import pickle
 import warnings
 from datetime import date, datetime
 
-from . import parsers
+import numpy as np
+
+from . import _kernels, parsers
 from .defaults import DEFAULT_SERIES_ID, DEFAULTS_SERIES_ATTRS
-from .download import Downloader
 from .errors import StaleDataWarning
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-# Parse data for use
-logger.info("Parsing data files from the BLS")
-areas = parsers.ParseArea().parse()
-items = parsers.ParseItem().parse()
-periods = parsers.ParsePeriod().parse()
-periodicities = parsers.ParsePeriodicity().parse()
-series = parsers.ParseSeries(
-    periods=periods, periodicities=periodicities, areas=areas, items=items
-).parse()
-
-# set the default series to the CPI-U
-DEFAULT_SERIES = series.get_by_id(DEFAULT_SERIES_ID)
-
-# Establish the range of data available
-LATEST_MONTH = DEFAULT_SERIES.latest_month
-LATEST_YEAR = DEFAULT_SERIES.latest_year
-
-# Figure out how out of date you are
-DAYS_SINCE_LATEST_MONTH = (date.today() - LATEST_MONTH).days
-DAYS_SINCE_LATEST_YEAR = (date.today() - date(LATEST_YEAR, 1, 1)).days
-
-# If it's more than two and a half years out of date, raise a warning.
-if DAYS_SINCE_LATEST_YEAR > (365 * 2.25) or DAYS_SINCE_LATEST_MONTH > 90:
-    warnings.warn(StaleDataWarning(), stacklevel=2)
-    logger.warn(
-        "CPI data is out of date. To accurately inflate to today's dollars, you must run `cpi.update()`."
+# The attributes that are parsed from the data files on first access.
+_LAZY_ATTRS = (
+    "areas",
+    "items",
+    "periods",
+    "periodicities",
+    "series",
+    "DEFAULT_SERIES",
+    "EARLIEST_MONTH",
+    "EARLIEST_YEAR",
+    "LATEST_MONTH",
+    "LATEST_YEAR",
+    "DAYS_SINCE_LATEST_MONTH",
+    "DAYS_SINCE_LATEST_YEAR",
+)
+
+# The subset that only needs the small mapping tables, so looking one up
+# never has to walk the millions of index rows.
+_METADATA_ATTRS = frozenset({"areas", "items", "periods", "periodicities"})
+
+
+# Bump this whenever the parsed object graph changes shape, so stale
+# caches written by older releases are rebuilt instead of loaded.
+_CACHE_VERSION = 9
+
+
+def _read_cache(cache_path, mtime_ns):
+    """
+    Returns the cached object graph, or None if it is missing or stale.
+    """
+    try:
+        # A 1 MB buffer keeps syscall counts low on the multi-megabyte
+        # pickle.
+        with open(cache_path, "rb", buffering=1 << 20) as fp:
+            version, cached_mtime_ns, payload = pickle.load(fp)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if version != _CACHE_VERSION or cached_mtime_ns != mtime_ns:
+        return None
+    return payload
+
+
+def _write_cache(cache_path, mtime_ns, payload):
+    """
+    Writes the parsed object graph to the cache file atomically.
+    """
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as fp:
+            pickle.dump(
+                (_CACHE_VERSION, mtime_ns, payload),
+                fp,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        # os.replace is atomic, so a crash mid-write never leaves a torn
+        # cache behind for the next import to trip over.
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is purely an accelerant. A read-only install just
+        # parses every time.
+        pass
+
+
+def _load_metadata():
+    """
+    Parses just the small mapping tables and fills in their globals.
+
+    Sessions that only list areas or items skip the series and index
+    parse entirely; a later full load simply replaces these globals.
+    """
+    if "areas" in globals():
+        return
+    areas, items, periods, periodicities = parsers.parse_defaults()
+    globals().update(
+        areas=areas,
+        items=items,
+        periods=periods,
+        periodicities=periodicities,
+    )
+
+
+def _load():
+    """
+    Parses the data and fills in the module globals on first use.
+
+    Deferring the parse means scripts only pay for it when they actually
+    look something up, not on every `import cpi`.
+    """
+    if "series" in globals():
+        return
+
+    # Unpickling the previously parsed object graph is much faster than
+    # rebuilding it, so try the cache first. It is keyed on the database's
+    # mtime and dropped by update(), so a fresh download always reparses.
+    this_dir = os.path.dirname(__file__)
+    cache_path = os.path.join(this_dir, "cpi.cache")
+    mtime_ns = os.stat(os.path.join(this_dir, "cpi.db")).st_mtime_ns
+    cached = _read_cache(cache_path, mtime_ns)
+    if cached is not None:
+        areas, items, periods, periodicities, series = cached
+    else:
+        # Parse data for use, reusing any mapping tables the metadata
+        # fast path already built.
+        logger.info("Parsing data files from the BLS")
+        areas, items, periods, periodicities = parsers.parse_defaults()
+        series = parsers.ParseSeries(
+            periods=periods, periodicities=periodicities, areas=areas, items=items
+        ).parse()
+        _write_cache(
+            cache_path, mtime_ns, (areas, items, periods, periodicities, series)
+        )
+
+    # set the default series to the CPI-U
+    default_series = series.get_by_id(DEFAULT_SERIES_ID)
+
+    # Establish the range of data available, scanning each series once
+    # rather than recomputing the bounds on demand.
+    earliest_month = default_series.earliest_month
+    earliest_year = default_series.earliest_year
+    latest_month = default_series.latest_month
+    latest_year = default_series.latest_year
+
+    globals().update(
+        areas=areas,
+        items=items,
+        periods=periods,
+        periodicities=periodicities,
+        series=series,
+        DEFAULT_SERIES=default_series,
+        EARLIEST_MONTH=earliest_month,
+        EARLIEST_YEAR=earliest_year,
+        LATEST_MONTH=latest_month,
+        LATEST_YEAR=latest_year,
+    )
+
+
+def _series():
+    """
+    Returns the loaded series list for internal callers.
+
+    Reading through a helper keeps the module free of a static `series`
+    binding, which would stop __getattr__'s lazy load from firing.
+    """
+    _load()
+    return globals()["series"]
+
+
+def _latest_month():
+    """
+    Returns the latest month available, loading the data if needed.
+    """
+    _load()
+    return globals()["LATEST_MONTH"]
+
+
+def _latest_year():
+    """
+    Returns the latest year available, loading the data if needed.
+    """
+    _load()
+    return globals()["LATEST_YEAR"]
+
+
+@functools.cache
+def _check_freshness():
+    """
+    Warns if the data is out of date.
+
+    The cache makes this a one-shot per process, so the date.today()
+    call and the warnings machinery only run on the first lookup.
+    """
+    _load()
+
+    # Figure out how out of date you are
+    today = date.today()
+    days_since_latest_month = (today - _latest_month()).days
+    days_since_latest_year = (today - date(_latest_year(), 1, 1)).days
+
+    globals().update(
+        DAYS_SINCE_LATEST_MONTH=days_since_latest_month,
+        DAYS_SINCE_LATEST_YEAR=days_since_latest_year,
     )
 
+    # If it's more than two and a half years out of date, raise a warning.
+    if days_since_latest_year > (365 * 2.25) or days_since_latest_month > 90:
+        warnings.warn(StaleDataWarning(), stacklevel=2)
+        logger.warn(
+            "CPI data is out of date. To accurately inflate to today's dollars, you must run `cpi.update()`."
+        )
+
+
+def __getattr__(name):
+    """
+    Loads the parsed data the first time one of its attributes is requested.
+    """
+    if name in _METADATA_ATTRS:
+        _load_metadata()
+        return globals()[name]
+    if name in _LAZY_ATTRS:
+        _load()
+        if name not in globals():
+            # The staleness counters are filled in by the freshness check.
+            _check_freshness()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get(
     year_or_month,
@@ -57,28 +239,103 @@ def get(
     """
     Returns the CPI value for a given year.
     """
+    _check_freshness()
+
     # Pull the series
     if series_id:
         # If the user has provided an explicit series id, we are going to ignore the humanized options.
-        series_obj = series.get_by_id(series_id)
+        series_obj = _series().get_by_id(series_id)
     else:
         # Otherwise, we build the series id using the more humanized options
-        series_obj = series.get(survey, seasonally_adjusted, periodicity, area, items)
+        series_obj = _series().get(
+            survey, seasonally_adjusted, periodicity, area, items
+        )
 
-    # Prep the lookup value depending on the input type.
-    if isinstance(year_or_month, numbers.Integral):
-        year_or_month = date(year_or_month, 1, 1)
-        period_type = "annual"
-    elif isinstance(year_or_month, date):
-        period_type = "monthly"
-        # If it's not set to the first day of the month, we should do that now.
-        if year_or_month.day != 1:
-            year_or_month = year_or_month.replace(day=1)
-    else:
-        raise ValueError("Only integers and date objects are accepted.")
+    # Pull the value from the series
+    return _cached_value(series_obj.id, year_or_month)
 
-    # Pull the value from the series by date
-    return series_obj.get_index_by_date(year_or_month, period_type=period_type).value
+
+def _annual_value(series_obj, year):
+    """
+    Returns the CPI value for a given year from the provided series.
+
+    Integers hit a contiguous per-series array indexed by year offset,
+    which is much cheaper than hashing a date object per call.
+    """
+    return series_obj.get_annual_value(int(year))
+
+
+def _monthly_value(series_obj, month):
+    """
+    Returns the CPI value for a given month from the provided series.
+
+    Dates resolve with a binary search over a sorted month array. The
+    datetime64 truncation folds non-first-of-month dates to their month,
+    so no replace(day=1) copy is needed first.
+    """
+    return series_obj.get_monthly_value(month)
+
+
+# Maps concrete input types straight to their lookup path, so the common
+# case is a single dict hit instead of an isinstance ladder walking the
+# numbers.Integral ABC and the datetime subclass chain on every call.
+_DISPATCH = {
+    int: _annual_value,
+    np.int64: _annual_value,
+    np.int32: _annual_value,
+    date: _monthly_value,
+    datetime: _monthly_value,
+}
+
+
+def _resolve_handler(year_or_month):
+    """
+    Returns the lookup handler for the given year or month, validating it.
+    """
+    try:
+        return _DISPATCH[type(year_or_month)]
+    except KeyError:
+        # Unfamiliar types fall back to the slower isinstance checks once,
+        # then join the table for next time.
+        if isinstance(year_or_month, numbers.Integral):
+            handler = _annual_value
+        elif isinstance(year_or_month, date):
+            handler = _monthly_value
+        else:
+            raise ValueError("Only integers and date objects are accepted.")
+        _DISPATCH[type(year_or_month)] = handler
+        return handler
+
+
+def _get_value(series_obj, year_or_month):
+    """
+    Returns the CPI value for a given year or month from the provided series.
+    """
+    return _resolve_handler(year_or_month)(series_obj, year_or_month)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_lookup(handler, series_id, year_or_month):
+    """
+    Returns the CPI value for the given handler, series id and year or month.
+
+    The callers pass a small set of repeated arguments — no `to` means
+    the latest period, and loops hit the same few dates — so the memo
+    turns most lookups into a dict hit. update() clears it.
+    """
+    return handler(_series().get_by_id(series_id), year_or_month)
+
+
+def _cached_value(series_id, year_or_month):
+    """
+    Returns the memoized CPI value for the given series id and year or month.
+
+    Dispatch runs before the memo so validation never depends on cache
+    state: a float is rejected even when it compares equal to a cached
+    integer year, and the handler in the key separates annual from
+    monthly lookups.
+    """
+    return _cached_lookup(_resolve_handler(year_or_month), series_id, year_or_month)
 
 
 def inflate(
@@ -105,16 +362,14 @@ def inflate(
 
     Yearly data can only be updated to other years. Monthly data can only be updated to other months.
     """
-    # If the two dates match, just return the value unadjusted
-    if year_or_month == to:
-        return value
+    _check_freshness()
 
     # Figure out the 'to' date if it has not been provided
     if not to:
         if isinstance(year_or_month, (date, datetime)):
-            to = LATEST_MONTH
+            to = _latest_month()
         else:
-            to = LATEST_YEAR
+            to = _latest_year()
     # Otherwise sanitize it
     else:
         if isinstance(to, numbers.Integral):
@@ -132,6 +387,12 @@ def inflate(
     elif isinstance(year_or_month, datetime):
         year_or_month = year_or_month.date()
 
+    # If the two dates match, just return the value unadjusted. Checking
+    # after normalization means datetime-vs-date identities qualify too,
+    # instead of rounding through two index lookups.
+    if year_or_month == to:
+        return value
+
     # Make sure the two dates are the same type
     if type(year_or_month) is not type(to):
         raise TypeError(
@@ -139,19 +400,83 @@ def inflate(
         )
 
     # Otherwise, let's do the math.
+    # Resolve the series once and reuse it for both lookups, rather than
+    # paying the id resolution twice by calling get() per date.
+    if series_id:
+        series_obj = _series().get_by_id(series_id)
+    else:
+        series_obj = _series().get(
+            survey, seasonally_adjusted, periodicity, area, items
+        )
+
     # The input value is multiplied by the CPI of the target year,
     # then divided into the CPI from the source year.
-    kwargs = {
-        "survey": survey,
-        "seasonally_adjusted": seasonally_adjusted,
-        "periodicity": periodicity,
-        "area": area,
-        "items": items,
-        "series_id": series_id,
-    }
-    source_index = get(year_or_month, **kwargs)
-    target_index = get(to, **kwargs)
-    return (value * target_index) / float(source_index)
+    # The lookup methods already hand back floats, so no coercion is
+    # needed before the math.
+    source_index = _cached_value(series_obj.id, year_or_month)
+    target_index = _cached_value(series_obj.id, to)
+    return _kernels.inflate_scalar(value, target_index, source_index)
+
+
+def inflate_array(
+    values,
+    years_or_months,
+    to=None,
+    survey=DEFAULTS_SERIES_ATTRS["survey"],
+    seasonally_adjusted=DEFAULTS_SERIES_ATTRS["seasonally_adjusted"],
+    periodicity=DEFAULTS_SERIES_ATTRS["periodicity"],
+    area=DEFAULTS_SERIES_ATTRS["area"],
+    items=DEFAULTS_SERIES_ATTRS["items"],
+    series_id=None,
+):
+    """
+    Returns an array of dollar values adjusted for inflation.
+
+    A vectorized version of `inflate` for bulk use. You must submit array-likes
+    of the values and the years or months they are from. The adjustment for the
+    whole batch is computed in NumPy with a single pass, which is much faster
+    than calling `inflate` once per row.
+
+    Years should be submitted as integers. Months as datetime.date objects or
+    anything NumPy can coerce to a month, like Pandas datetime columns.
+    """
+    _check_freshness()
+
+    # Pull the series
+    if series_id:
+        series_obj = _series().get_by_id(series_id)
+    else:
+        series_obj = _series().get(
+            survey, seasonally_adjusted, periodicity, area, items
+        )
+
+    values = np.asarray(values, dtype=np.float64)
+    years_or_months = np.asarray(years_or_months)
+
+    # Integer input means annual data. Everything else is treated as monthly.
+    if np.issubdtype(years_or_months.dtype, np.integer):
+        if to is None:
+            to = _latest_year()
+        elif not isinstance(to, numbers.Integral):
+            raise TypeError(
+                "Years can only be converted to other years. Months only to other months."
+            )
+        source_index = series_obj.get_annual_values(years_or_months)
+        target_index = series_obj.get_annual_value(int(to))
+    else:
+        if to is None:
+            to = _latest_month()
+        elif isinstance(to, numbers.Integral):
+            raise TypeError(
+                "Years can only be converted to other years. Months only to other months."
+            )
+        source_index = series_obj.get_monthly_values(years_or_months)
+        target_index = series_obj.get_monthly_values(
+            np.asarray([to], dtype="datetime64[M]")
+        )[0]
+
+    # Same arithmetic as the scalar `inflate`, applied to the whole batch.
+    return _kernels.inflate_vector(values, target_index, source_index)
 
 
 def update():
@@ -160,4 +485,10 @@ def update():
 
     Requires an Internet connection.
     """
+    # Deferred import: the downloader pulls in pandas and requests, which
+    # nobody else needs just to look up an index.
+    from .download import Downloader
+
     Downloader().update()
+    # Memoized values belong to the old dataset.
+    _cached_lookup.cache_clear()
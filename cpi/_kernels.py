@@ -0,0 +1,37 @@
+#! /usr/bin/env python
+"""
+Kernels for the inflation arithmetic shared by the scalar and bulk paths.
+
+If numba is installed, the kernels are compiled to native code and cached
+between interpreter runs. Otherwise the pure Python definitions are used.
+Either way the arithmetic is identical, so results match bit for bit.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def inflate_scalar(value, target_index, source_index):
+    """
+    Returns a single value adjusted for inflation.
+    """
+    return (value * target_index) / source_index
+
+
+def inflate_vector(values, target_index, source_indexes):
+    """
+    Returns an array of values adjusted for inflation.
+    """
+    return (values * target_index) / source_indexes
+
+
+if njit is not None:
+    logger.debug("Compiling inflation kernels with numba")
+    inflate_scalar = njit(cache=True)(inflate_scalar)
+    inflate_vector = njit(cache=True)(inflate_vector)
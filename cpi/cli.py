@@ -2,6 +2,9 @@
 """
 Command-line interface.
 """
+import csv
+from datetime import date
+
 import click
 from dateutil.parser import parse as dateparse
 
@@ -12,12 +15,22 @@ import cpi
 @click.argument(
     "value",
     nargs=1,
-    required=True,
+    required=False,
+    default=None,
 )
 @click.argument(
     "year_or_month",
     nargs=1,
-    required=True,
+    required=False,
+    default=None,
+)
+@click.option(
+    "--file",
+    "file_path",
+    type=click.Path(exists=True),
+    nargs=1,
+    default=None,
+    help="A CSV of value,year_or_month rows to adjust in bulk instead of a single value.",
 )
 @click.option(
     "--to", nargs=1, default=None, help="The year or month to adjust the value to."
@@ -29,10 +42,45 @@ import cpi
     default=cpi.DEFAULT_SERIES_ID,
     help="The CPI data series used for the conversion. The default is the CPI-U.",
 )
-def inflate(value, year_or_month, to=None, series_id=cpi.DEFAULT_SERIES):
+def inflate(
+    value, year_or_month, file_path=None, to=None, series_id=cpi.DEFAULT_SERIES_ID
+):
     """
     Returns a dollar value adjusted for inflation.
     """
+    # Sanitize the `to` date up front so both paths share it.
+    if to:
+        try:
+            to = _parse_date(to)
+        except ValueError:
+            raise click.ClickException(
+                "Source date must be a year as an integer or a month as a parseable date string."
+            )
+
+    # In batch mode the whole file adjusts through one vectorized call,
+    # so the dataset loads once no matter how many rows come in.
+    if file_path:
+        with open(file_path, newline="") as fp:
+            rows = list(csv.reader(fp))
+        values, dates = [], []
+        for line_number, row in enumerate(rows, start=1):
+            # Skip blank lines.
+            if not row:
+                continue
+            try:
+                values.append(float(row[0]))
+                dates.append(_parse_date(row[1]))
+            except (IndexError, ValueError):
+                raise click.ClickException(
+                    f"Could not parse line {line_number} of {file_path}: {row}"
+                )
+        results = cpi.inflate_array(values, dates, to=to, series_id=series_id)
+        click.echo("\n".join(str(result) for result in results))
+        return
+
+    if value is None or year_or_month is None:
+        raise click.UsageError("Provide VALUE and YEAR_OR_MONTH, or --file.")
+
     # Sanitize the value
     try:
         value = float(value)
@@ -47,15 +95,6 @@ def inflate(value, year_or_month, to=None, series_id=cpi.DEFAULT_SERIES):
             "Source date must be a year as an integer or a month as a parseable date string."
         )
 
-    # Sanitize the `to` date.
-    if to:
-        try:
-            to = _parse_date(to)
-        except ValueError:
-            click.ClickException(
-                "Source date must be a year as an integer or a month as a parseable date string."
-            )
-
     # Run the command
     result = cpi.inflate(value, year_or_month, to=to, series_id=series_id)
 
@@ -71,5 +110,11 @@ def _parse_date(value):
     """
     try:
         return int(value)
+    except ValueError:
+        pass
+    try:
+        # ISO dates are the common case and don't need dateutil's
+        # format-guessing machinery.
+        return date.fromisoformat(value)
     except ValueError:
         return dateparse(value).date()
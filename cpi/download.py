@@ -1,21 +1,53 @@
 """Download the latest annual Consumer Price Index (CPI) dataset."""
-import csv
+import json
 import logging
 import sqlite3
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    # pyarrow is optional. When it's around, the TSVs parse with a thread
+    # per block and trim their whitespace in C instead of through pandas.
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover
+    pa = pc = pacsv = None
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# One session shared by all downloads, so every worker reuses the same
+# TCP and TLS handshake to the BLS instead of opening a fresh connection
+# per file. Transient server hiccups retry with backoff.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+
 
 class Downloader:
     """Download the latest data."""
 
     THIS_DIR: Path = Path(__file__).parent.absolute()
+    # Build the output paths once at class definition rather than gluing
+    # the same segments back together on every call.
+    DB_PATH: Path = THIS_DIR / "cpi.db"
+    NPZ_PATH: Path = THIS_DIR / "cpi.npz"
+    CACHE_PATH: Path = THIS_DIR / "cpi.cache"
+    DATA_DIR: Path = THIS_DIR / "data"
     FILE_LIST: typing.List[str] = [
         "cu.area",
         "cu.item",
@@ -47,85 +79,321 @@ class Downloader:
 
     def get_data_dir(self) -> Path:
         """Return the directory Path where data will be stored."""
-        data_dir = self.THIS_DIR / "data"
-        data_dir.mkdir(exist_ok=True, parents=True)
-        return data_dir
-
-    def rm(self):
-        """Remove any existing files."""
-        db_path = self.THIS_DIR / "cpi.db"
-        if db_path.exists():
-            logger.debug(f"Deleting {db_path}")
-            db_path.unlink()
+        self.DATA_DIR.mkdir(exist_ok=True, parents=True)
+        return self.DATA_DIR
+
+    # Guards the read-modify-write of etags.json across download workers.
+    _ETAG_LOCK = threading.Lock()
+
+    def _etag_path(self) -> Path:
+        """Return the Path where response validators are recorded."""
+        return self.get_data_dir() / "etags.json"
+
+    def _read_etags(self) -> dict:
+        """Return the recorded response validators by file name."""
+        with self._ETAG_LOCK:
+            try:
+                return json.loads(self._etag_path().read_text())
+            except (OSError, ValueError):
+                return {}
+
+    def _record_etag(self, file: str, headers):
+        """Record the response validators for the provided file."""
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        if not any(validators.values()):
+            return
+        with self._ETAG_LOCK:
+            try:
+                etags = json.loads(self._etag_path().read_text())
+            except (OSError, ValueError):
+                etags = {}
+            etags[file] = validators
+            self._etag_path().write_text(json.dumps(etags, indent=2))
+
+    def rm(self, keep_downloads: bool = False):
+        """Remove any existing files.
+
+        Pass keep_downloads=True to leave the raw TSVs and their recorded
+        validators in place, so conditional fetches can reuse them.
+        """
+        for path in (self.DB_PATH, self.NPZ_PATH, self.CACHE_PATH):
+            if path.exists():
+                logger.debug(f"Deleting {path}")
+                path.unlink()
+        if keep_downloads:
+            return
         data_dir = self.get_data_dir()
-        for f in data_dir.glob(".csv"):
+        etag_path = self._etag_path()
+        if etag_path.exists():
+            logger.debug(f"Deleting {etag_path}")
+            etag_path.unlink()
+        for f in data_dir.glob("*.csv"):
             logger.debug(f"Deleting {f}")
             f.unlink()
-        for f in data_dir.glob(".tsv"):
+        for f in data_dir.glob("*.tsv"):
             logger.debug(f"Deleting {f}")
             f.unlink()
 
     def update(self):
         """Update the Consumer Price Index dataset that powers this library."""
-        # Delete existing files
-        self.rm()
-
-        # Download the TSVs
+        # Download the TSVs, overlapping the requests so the wait on one
+        # response doesn't block the others. The conditional fetches only
+        # pull files the BLS has actually changed and report back which.
         logger.debug(f"Downloading {len(self.FILE_LIST)} files from the BLS")
-        [self.get_tsv(file) for file in self.FILE_LIST]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            downloaded = list(pool.map(self.get_tsv, self.FILE_LIST))
+        changed = {f for f, new in zip(self.FILE_LIST, downloaded) if new}
+
+        # Build the database in RAM, then flush it to disk in one
+        # sequential pass with the backup API. Ingesting straight into the
+        # file paid journal frames and checkpoint I/O per table; this way
+        # the only disk writes are the final page-ordered copy. The full
+        # dataset fits comfortably in memory.
+        conn = sqlite3.connect(":memory:")
+        try:
+            # Set a larger page size before the first table exists. Bigger
+            # pages mean fewer B-tree writes during the bulk inserts.
+            conn.execute("PRAGMA page_size=65536")
+
+            # Seed the build from the existing database, so only the
+            # tables whose source file changed need to be re-ingested.
+            # Most reference tables barely ever do.
+            db_path = self.DB_PATH
+            existing: set = set()
+            if db_path.exists():
+                disk = sqlite3.connect(db_path)
+                try:
+                    disk.backup(conn)
+                finally:
+                    disk.close()
+                existing = {
+                    name
+                    for (name,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table'"
+                    )
+                }
+
+            stale = [f for f in self.FILE_LIST if f in changed or f not in existing]
+            logger.debug(f"Loading {len(stale)} tables into SQLite database")
+            with conn:
+                [self.insert_tsv(file, conn) for file in stale]
 
-        # Insert the TSVs
-        logger.debug("Loading data into SQLite database")
-        [self.insert_tsv(file) for file in self.FILE_LIST]
+            # Replace the built artifacts on disk only once the new build
+            # is complete, then write the finished database in one pass.
+            self.rm(keep_downloads=True)
+            disk = sqlite3.connect(db_path)
+            try:
+                with disk:
+                    conn.backup(disk)
+            finally:
+                disk.close()
+        finally:
+            conn.close()
 
-    def insert_tsv(self, file: str):
-        """Load the provided TSV file."""
-        # Connect to db
-        db_path = self.THIS_DIR / "cpi.db"
-        conn = sqlite3.connect(db_path)
+        # Export the index tables to a NumPy archive for fast parsing
+        self.export_npz()
 
-        # Read file
+    def export_npz(self):
+        """Export the index tables to a single typed NumPy archive.
+
+        Loading the archive is a single mmap and header parse, which lets the
+        parser skip the row-by-row SQL walk across all the data tables.
+        """
+        # Stream each table out in chunks and keep only the typed column
+        # arrays, so peak memory stays near one copy of the data instead
+        # of a full DataFrame plus its concatenated duplicate.
+        columns: dict = {"series_id": [], "year": [], "period": [], "value": []}
+        dtypes = {
+            "series_id": np.str_,
+            "year": np.int64,
+            "period": np.str_,
+            "value": np.float64,
+        }
+        conn = sqlite3.connect(self.DB_PATH)
+        try:
+            for file in self.FILE_LIST:
+                if not file.startswith("cu.data."):
+                    continue
+                chunks = pd.read_sql_query(
+                    f'SELECT series_id, year, period, value FROM "{file}"',
+                    conn,
+                    chunksize=200_000,
+                )
+                for chunk in chunks:
+                    for name, arrays in columns.items():
+                        arrays.append(chunk[name].to_numpy(dtype=dtypes[name]))
+        finally:
+            conn.close()
+        np.savez_compressed(
+            self.NPZ_PATH,
+            **{name: np.concatenate(arrays) for name, arrays in columns.items()},
+        )
+
+    def _iter_tsv(self, tsv_path: Path) -> typing.Iterator[pd.DataFrame]:
+        """Yield stripped DataFrame chunks from the provided TSV file.
+
+        With pyarrow installed the parse runs multi-threaded and the
+        whitespace trim happens in C over Arrow's contiguous string
+        buffers before anything becomes a Python object. Otherwise the
+        chunks come through pandas' C parser.
+        """
+        # Read just the header up front. Both engines need the raw names
+        # to pin every column to string, and handing the parser clean
+        # names saves renaming the columns of every parsed chunk after
+        # the fact.
+        with open(tsv_path, encoding="utf-8") as fp:
+            raw_names = fp.readline().rstrip("\r\n").split("\t")
+        columns = [name.strip() for name in raw_names]
+
+        if pacsv is not None:
+            reader = pacsv.open_csv(
+                tsv_path,
+                read_options=pacsv.ReadOptions(block_size=1 << 20),
+                parse_options=pacsv.ParseOptions(delimiter="\t"),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in raw_names}
+                ),
+            )
+            for batch in reader:
+                arrays = [pc.utf8_trim_whitespace(col) for col in batch.columns]
+                yield pa.table(dict(zip(columns, arrays))).to_pandas()
+            return
+
+        chunks = pd.read_csv(
+            tsv_path,
+            sep="\t",
+            dtype=str,
+            keep_default_na=False,
+            chunksize=50_000,
+            names=columns,
+            header=0,
+            # Parse straight off kernel-cached pages instead of copying
+            # the file through Python's buffered reader.
+            memory_map=True,
+        )
+        for chunk in chunks:
+            # Column-at-a-time .str.strip() stays in pandas' vectorized
+            # path rather than bouncing through an apply() callback.
+            for col in columns:
+                chunk[col] = chunk[col].str.strip()
+            yield chunk
+
+    def insert_tsv(self, file: str, conn: sqlite3.Connection):
+        """Load the provided TSV file into the provided database connection."""
+        # Read the raw TSV with a C parser. Rewriting it as a CSV first
+        # copied every file through Python twice for nothing.
         logger.debug(f" - {file}")
-        csv_path = self.get_data_dir() / f"{file}.csv"
-        csv_reader = list(csv.DictReader(open(csv_path)))
+        tsv_path = self.get_data_dir() / f"{file}.tsv"
+
+        # The big observation tables stream through in bounded chunks and
+        # skip pandas' SQL layer for a prepared statement, which is the
+        # fastest ingest path SQLite has. Chunking caps peak memory at one
+        # slice of the largest table rather than the whole parsed frame.
+        if file.startswith("cu.data."):
+            create = True
+            for chunk in self._iter_tsv(tsv_path):
+                self._bulk_insert(file, chunk, conn, create=create)
+                create = False
+            return
+
+        df = pd.concat(self._iter_tsv(tsv_path), ignore_index=True)
 
-        # Convert it to a DataFrame
-        df = pd.DataFrame(csv_reader)
-        df.drop([None], axis=1, inplace=True, errors="ignore")
+        # The small metadata tables write with multi-row INSERTs. The
+        # default emits one statement per row; batching collapses the round
+        # trips. SQLite caps bound parameters per statement, so size each
+        # batch to stay under the 999-variable floor of older builds.
+        chunksize = 999 // len(df.columns)
+        df.to_sql(
+            file,
+            conn,
+            if_exists="replace",
+            index=False,
+            method="multi",
+            chunksize=chunksize,
+        )
 
-        # Write file to db
-        df.to_sql(file, conn, if_exists="replace", index=False)
+    def _bulk_insert(
+        self,
+        file: str,
+        df: pd.DataFrame,
+        conn: sqlite3.Connection,
+        create: bool = True,
+    ):
+        """Insert the provided DataFrame with a single prepared statement.
 
-        # Close connection
-        conn.close()
+        pandas' to_sql rebuilds and re-parses its SQL for every chunk.
+        executemany prepares the INSERT once and streams plain tuples
+        through it, the cheapest row iterator pandas offers. Pass
+        create=False to append to a table built by an earlier chunk.
+        """
+        if create:
+            # No indexes, keys or constraints: every INSERT below stays a
+            # pure append with no per-row B-tree maintenance. The parsers
+            # read these tables with full scans, so nothing needs an index;
+            # if one is ever added, build it here after the load finishes,
+            # never in the CREATE TABLE.
+            #
+            # year and value get numeric affinity so SQLite stores and
+            # returns them typed, sparing readers a Python cast per row.
+            affinities = {"year": "INTEGER", "value": "REAL"}
+            columns = ", ".join(
+                f'"{c}" {affinities.get(c, "TEXT")}' for c in df.columns
+            )
+            conn.execute(f'DROP TABLE IF EXISTS "{file}"')
+            conn.execute(f'CREATE TABLE "{file}" ({columns})')
+        placeholders = ", ".join("?" * len(df.columns))
+        conn.executemany(
+            f'INSERT INTO "{file}" VALUES ({placeholders})',
+            df.itertuples(index=False, name=None),
+        )
 
-    def get_tsv(self, file: str):
-        """Download TSV file from the BLS."""
+    def get_tsv(self, file: str) -> bool:
+        """Download TSV file from the BLS.
+
+        Returns True if new content was fetched, False if the copy on
+        disk is still current.
+        """
         # Download it
         url = f"https://download.bls.gov/pub/time.series/cu/{file}"
         logger.debug(f" - {url}")
         tsv_path = self.get_data_dir() / f"{file}.tsv"
         headers = {
             "User-Agent": "b@palewi.re",
+            # requests sends this by default, but the TSVs compress to a
+            # fraction of their size, so pin it rather than trust defaults.
+            "Accept-Encoding": "gzip, deflate",
         }
-        response = requests.get(url, headers=headers, timeout=30)
+
+        # The BLS files change monthly at most. If we still have the last
+        # download, ask the server to skip the body unless it has changed.
+        cached = self._read_etags().get(file)
+        if cached and tsv_path.exists():
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = SESSION.get(url, headers=headers, timeout=30, stream=True)
+        if response.status_code == 304:
+            logger.debug(f" - {file} unchanged, reusing the cached download")
+            return False
         try:
             assert response.ok
         except AssertionError:
             logger.error(f"Error downloading {url}")
             logger.error(f"Response: {response.text}")
             raise AssertionError(f"Error downloading {url}")
-        with open(tsv_path, "w") as fp:
-            fp.write(response.text)
-
-        # Convert it to csv
-        with open(tsv_path) as in_file:
-            reader = csv.reader(in_file, delimiter="\t")
-            csv_path = self.get_data_dir() / f"{file}.csv"
-            with open(csv_path, "w") as out_file:
-                writer = csv.writer(out_file)
-                for row in reader:
-                    writer.writerow([cell.strip() for cell in row])
+        # Stream the body straight to disk so the full file is never
+        # buffered in memory as a Python string. The 1 MB buffer matches
+        # the chunk size, so each chunk flushes in one write syscall.
+        with open(tsv_path, "wb", buffering=1 << 20) as fp:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                fp.write(chunk)
+        self._record_etag(file, response.headers)
+        return True
 
 
 if __name__ == "__main__":
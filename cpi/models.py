@@ -2,13 +2,11 @@
 """
 Python objects for modeling Consumer Price Index (CPI) data structures.
 """
-import collections
-
 # Logging
 import logging
 from datetime import date
 
-from pandas import json_normalize
+import numpy as np
 
 from .defaults import DEFAULTS_SERIES_ATTRS
 
@@ -19,15 +17,25 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-class MappingList(list):
+class MappingList:
     """
-    A custom list that allows for lookups by attribute.
+    An ordered collection that allows for lookups by attribute.
     """
 
+    # Composition instead of list inheritance: the id dict is the one
+    # canonical store, and insertion order comes along for free.
+    __slots__ = ("_id_dict", "_name_dict")
+
     def __init__(self):
         self._id_dict = {}
         self._name_dict = {}
 
+    def __iter__(self):
+        return iter(self._id_dict.values())
+
+    def __len__(self):
+        return len(self._id_dict)
+
     def get_by_id(self, value):
         try:
             return self._id_dict[value]
@@ -38,18 +46,45 @@ class MappingList(list):
         try:
             return self._name_dict[value]
         except KeyError:
-            raise CPIObjectDoesNotExist(f"Object with id {value} could not be found")
+            raise CPIObjectDoesNotExist(f"Object with name {value} could not be found")
 
     def append(self, item):
         """
-        Override to default append method that allows dictionary-style lookups
+        Adds the provided object to the collection.
         """
-        # Add to dictionary lookup
         self._id_dict[item.id] = item
         self._name_dict[item.name] = item
 
-        # Append to list
-        super().append(item)
+    def to_dataframe(self):
+        """
+        Returns the collection as a pandas DataFrame.
+        """
+        # Deferred so that `import cpi` doesn't pay the pandas import;
+        # only callers who actually build DataFrames do.
+        import pandas as pd
+
+        objects = list(self)
+        if not objects:
+            return pd.DataFrame()
+        # Build the frame column-major off the first object's fields, which
+        # skips serializing a dict per object.
+        columns = objects[0].to_dict().keys()
+        return pd.DataFrame(
+            {name: [getattr(o, name) for o in objects] for name in columns}
+        )
+
+    @classmethod
+    def from_iterable(cls, items):
+        """
+        Returns a new collection built from the provided objects.
+
+        Bulk construction fills both indexes with dict comprehensions
+        instead of paying a method call per object.
+        """
+        obj = cls()
+        obj._id_dict = {item.id: item for item in items}
+        obj._name_dict = {item.name: item for item in obj._id_dict.values()}
+        return obj
 
 
 class SeriesList(list):
@@ -68,13 +103,52 @@ class SeriesList(list):
         self.areas = areas
         self.items = items
         self._dict = {}
+        # Memoizes get()'s humanized-kwargs-to-series resolution. Inflation
+        # loops hammer the same few series, so the name lookups and id
+        # assembly only need to happen once per combination.
+        self._get_cache = {}
 
     def to_dataframe(self):
         """
         Returns the list as a pandas DataFrame.
         """
-        dict_list = [obj.__dict__() for obj in self]
-        return json_normalize(dict_list, sep="_")
+        # Deferred so that `import cpi` doesn't pay the pandas import;
+        # only callers who actually build DataFrames do.
+        import pandas as pd
+
+        # One pass appending to flat column lists, instead of serializing
+        # a nested dict per series for json_normalize to flatten row by
+        # row. Same columns as the old output.
+        cols = {
+            "id": [],
+            "title": [],
+            "survey": [],
+            "seasonally_adjusted": [],
+            "periodicity_id": [],
+            "periodicity_code": [],
+            "periodicity_name": [],
+            "area_id": [],
+            "area_code": [],
+            "area_name": [],
+            "items_id": [],
+            "items_code": [],
+            "items_name": [],
+        }
+        for obj in self:
+            cols["id"].append(obj.id)
+            cols["title"].append(obj.title)
+            cols["survey"].append(obj.survey)
+            cols["seasonally_adjusted"].append(obj.seasonally_adjusted)
+            cols["periodicity_id"].append(obj.periodicity.id)
+            cols["periodicity_code"].append(obj.periodicity.code)
+            cols["periodicity_name"].append(obj.periodicity.name)
+            cols["area_id"].append(obj.area.id)
+            cols["area_code"].append(obj.area.code)
+            cols["area_name"].append(obj.area.name)
+            cols["items_id"].append(obj.items.id)
+            cols["items_code"].append(obj.items.code)
+            cols["items_name"].append(obj.items.name)
+        return pd.DataFrame(cols)
 
     def append(self, item):
         """
@@ -113,6 +187,14 @@ class SeriesList(list):
 
         The default series is returned if not configuration is made to the keyword arguments.
         """
+        # Repeated calls with the same arguments resolve straight from
+        # the memo.
+        key = (survey, seasonally_adjusted, periodicity, area, items)
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+
         # Get all the codes for these humanized input.
         try:
             survey_code = self.SURVEYS[survey]
@@ -136,7 +218,9 @@ class SeriesList(list):
         )
 
         # Pull the series
-        return self.get_by_id(series_id)
+        series = self.get_by_id(series_id)
+        self._get_cache[key] = series
+        return series
 
 
 class BaseObject:
@@ -144,6 +228,9 @@ class BaseObject:
     An abstract base class for all the models.
     """
 
+    # Empty here so subclasses declaring __slots__ actually stay dict-free.
+    __slots__ = ()
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.__str__()}>"
 
@@ -159,12 +246,14 @@ class Area(BaseObject):
     A geographical area where prices are gathered monthly.
     """
 
+    __slots__ = ("id", "code", "name")
+
     def __init__(self, code, name):
         self.id = code
         self.code = code
         self.name = name
 
-    def __dict__(self):
+    def to_dict(self):
         return {"id": self.id, "code": self.code, "name": self.name}
 
 
@@ -173,12 +262,14 @@ class Item(BaseObject):
     A consumer item that has its price tracked.
     """
 
+    __slots__ = ("id", "code", "name")
+
     def __init__(self, code, name):
         self.id = code
         self.code = code
         self.name = name
 
-    def __dict__(self):
+    def to_dict(self):
         return {"id": self.id, "code": self.code, "name": self.name}
 
 
@@ -187,13 +278,36 @@ class Period(BaseObject):
     A time period tracked by the CPI.
     """
 
+    # Class-level constants so the classification properties don't rebuild
+    # a throwaway list on every access.
+    JANUARY_CODES = frozenset(["M13", "S01", "S03"])
+    ANNUAL_CODES = frozenset(["M13", "S03"])
+    SEMIANNUAL_CODES = frozenset(["S01", "S02"])
+
+    __slots__ = ("id", "code", "abbreviation", "name", "month", "type")
+
     def __init__(self, code, abbreviation, name):
         self.id = code
         self.code = code
         self.abbreviation = abbreviation
         self.name = name
+        # Classify the period up front. These are read once per index row
+        # during the parse and in every serialization, so computing them
+        # on each access added up.
+        if code in self.JANUARY_CODES:
+            self.month = 1
+        elif code == "S02":
+            self.month = 7
+        else:
+            self.month = int(code.replace("M", ""))
+        if code in self.ANNUAL_CODES:
+            self.type = "annual"
+        elif code in self.SEMIANNUAL_CODES:
+            self.type = "semiannual"
+        else:
+            self.type = "monthly"
 
-    def __dict__(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "code": self.code,
@@ -203,42 +317,20 @@ class Period(BaseObject):
             "type": self.type,
         }
 
-    @property
-    def month(self):
-        """
-        Returns the month integer for the period.
-        """
-        if self.id in ["M13", "S01", "S03"]:
-            return 1
-        elif self.id == "S02":
-            return 7
-        else:
-            return int(self.id.replace("M", ""))
-
-    @property
-    def type(self):
-        """
-        Returns a string classifying the period.
-        """
-        if self.id in ["M13", "S03"]:
-            return "annual"
-        elif self.id in ["S01", "S02"]:
-            return "semiannual"
-        else:
-            return "monthly"
-
 
 class Periodicity(BaseObject):
     """
     A time interval tracked by the CPI.
     """
 
+    __slots__ = ("id", "code", "name")
+
     def __init__(self, code, name):
         self.id = code
         self.code = code
         self.name = name
 
-    def __dict__(self):
+    def to_dict(self):
         return {"id": self.id, "code": self.code, "name": self.name}
 
 
@@ -251,6 +343,25 @@ class Series(BaseObject):
     Yes, that's the offical government definition. I'm not kidding.
     """
 
+    __slots__ = (
+        "id",
+        "title",
+        "survey",
+        "seasonally_adjusted",
+        "periodicity",
+        "area",
+        "items",
+        "_indexes",
+        "_annual_base",
+        "_annual_values",
+        "_month_keys",
+        "_month_values",
+        "_latest_month",
+        "_latest_year",
+        "_earliest_month",
+        "_earliest_year",
+    )
+
     def __init__(
         self, id, title, survey, seasonally_adjusted, periodicity, area, items
     ):
@@ -261,32 +372,79 @@ class Series(BaseObject):
         self.periodicity = periodicity
         self.area = area
         self.items = items
+        # Plain dicts preserve insertion order since Python 3.7 and skip
+        # the linked-list bookkeeping OrderedDict pays per entry.
         self._indexes = {
-            "annual": collections.OrderedDict(),
-            "monthly": collections.OrderedDict(),
-            "semiannual": collections.OrderedDict(),
+            "annual": {},
+            "monthly": {},
+            "semiannual": {},
         }
+        # Contiguous NumPy lookup tables built lazily from the indexes above.
+        # They let the hot `get` path avoid hashing Python objects per call.
+        self._annual_base = None
+        self._annual_values = None
+        self._month_keys = None
+        self._month_values = None
+        # Memoized bounds. The indexes never change after the parse, so
+        # each scan only ever needs to happen once.
+        self._latest_month = None
+        self._latest_year = None
+        self._earliest_month = None
+        self._earliest_year = None
 
     def __str__(self):
         return f"{self.id}: {self.title}"
 
-    def __dict__(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "title": self.title,
             "survey": self.survey,
             "seasonally_adjusted": self.seasonally_adjusted,
-            "periodicity": self.periodicity.__dict__(),
-            "area": self.area.__dict__(),
-            "items": self.items.__dict__(),
+            "periodicity": self.periodicity.to_dict(),
+            "area": self.area.to_dict(),
+            "items": self.items.to_dict(),
         }
 
     def to_dataframe(self):
         """
         Returns this series and all its indexes as a pandas DataFrame.
         """
-        dict_list = [obj.__dict__() for obj in self.indexes]
-        return json_normalize(dict_list, sep="_")
+        # Deferred so that `import cpi` doesn't pay the pandas import;
+        # only callers who actually build DataFrames do.
+        import pandas as pd
+
+        # Build the frame column-major, which skips serializing a nested
+        # dict per index and json_normalize's row-by-row flattening. The
+        # series fields repeat on every row, so they go in as scalars and
+        # pandas broadcasts them. Same columns as the old output.
+        indexes = self.indexes
+        return pd.DataFrame(
+            {
+                "year": [i.year for i in indexes],
+                "date": [str(i.date) for i in indexes],
+                "value": [i.value for i in indexes],
+                "series_id": self.id,
+                "series_title": self.title,
+                "series_survey": self.survey,
+                "series_seasonally_adjusted": self.seasonally_adjusted,
+                "series_periodicity_id": self.periodicity.id,
+                "series_periodicity_code": self.periodicity.code,
+                "series_periodicity_name": self.periodicity.name,
+                "series_area_id": self.area.id,
+                "series_area_code": self.area.code,
+                "series_area_name": self.area.name,
+                "series_items_id": self.items.id,
+                "series_items_code": self.items.code,
+                "series_items_name": self.items.name,
+                "period_id": [i.period.id for i in indexes],
+                "period_code": [i.period.code for i in indexes],
+                "period_abbreviation": [i.period.abbreviation for i in indexes],
+                "period_name": [i.period.name for i in indexes],
+                "period_month": [i.period.month for i in indexes],
+                "period_type": [i.period.type for i in indexes],
+            }
+        )
 
     @property
     def indexes(self):
@@ -295,17 +453,139 @@ class Series(BaseObject):
             flat.extend(obj.values())
         return flat
 
+    def _sort_indexes(self):
+        """
+        Sorts each index bucket chronologically.
+
+        The parser calls this once at the end of the load, after which the
+        bounds below read straight off the ends of each dict.
+        """
+        for key, bucket in self._indexes.items():
+            self._indexes[key] = dict(sorted(bucket.items()))
+
     @property
     def latest_month(self):
-        if not self._indexes["monthly"]:
-            return None
-        return max(i.date for i in self._indexes["monthly"].values())
+        if self._latest_month is None and self._indexes["monthly"]:
+            self._latest_month = next(reversed(self._indexes["monthly"]))
+        return self._latest_month
 
     @property
     def latest_year(self):
-        if not self._indexes["annual"]:
-            return None
-        return max(i.year for i in self._indexes["annual"].values())
+        if self._latest_year is None and self._indexes["annual"]:
+            self._latest_year = next(reversed(self._indexes["annual"])).year
+        return self._latest_year
+
+    @property
+    def earliest_month(self):
+        if self._earliest_month is None and self._indexes["monthly"]:
+            self._earliest_month = next(iter(self._indexes["monthly"]))
+        return self._earliest_month
+
+    @property
+    def earliest_year(self):
+        if self._earliest_year is None and self._indexes["annual"]:
+            self._earliest_year = next(iter(self._indexes["annual"])).year
+        return self._earliest_year
+
+    def _build_tables(self):
+        """
+        Builds the contiguous NumPy lookup tables from the parsed indexes.
+        """
+        # Annual values go into one array indexed by year offset, with NaN
+        # filling any gaps in the published range.
+        annual = self._indexes["annual"].values()
+        if annual:
+            years = [i.year for i in annual]
+            base = min(years)
+            values = np.full(max(years) - base + 1, np.nan, dtype=np.float64)
+            for index in annual:
+                values[index.year - base] = index.value
+            self._annual_base = base
+            self._annual_values = values
+        else:
+            self._annual_base = 0
+            self._annual_values = np.empty(0, dtype=np.float64)
+
+        # Monthly values go into a sorted pair of key and value arrays.
+        monthly = self._indexes["monthly"]
+        keys = np.array(sorted(monthly.keys()), dtype="datetime64[M]")
+        self._month_keys = keys
+        self._month_values = np.array(
+            [monthly[k].value for k in keys.astype(object)], dtype=np.float64
+        )
+
+    def get_annual_value(self, year):
+        """
+        Returns the annual CPI value for the provided year.
+        """
+        if self._annual_values is None:
+            self._build_tables()
+        offset = year - self._annual_base
+        values = self._annual_values
+        if 0 <= offset < values.size:
+            value = values[offset]
+            # NaN marks a year missing from the published range.
+            if value == value:
+                return float(value)
+        raise CPIObjectDoesNotExist(
+            f"Index of annual type for {date(year, 1, 1)} does not exist"
+        )
+
+    def get_annual_values(self, years):
+        """
+        Returns annual CPI values for an array of years as a NumPy array.
+        """
+        if self._annual_values is None:
+            self._build_tables()
+        years = np.asarray(years, dtype=np.int64)
+        offsets = years - self._annual_base
+        in_range = (offsets >= 0) & (offsets < self._annual_values.size)
+        values = self._annual_values[np.where(in_range, offsets, 0)]
+        # Out-of-range years and NaN gaps are both missing data.
+        missing = ~in_range | np.isnan(values)
+        if missing.any():
+            bad_year = int(years[missing.argmax()])
+            raise CPIObjectDoesNotExist(
+                f"Index of annual type for {date(bad_year, 1, 1)} does not exist"
+            )
+        return values
+
+    def get_monthly_value(self, month):
+        """
+        Returns the monthly CPI value for the provided date.
+        """
+        if self._month_keys is None:
+            self._build_tables()
+        key = np.datetime64(month, "M")
+        keys = self._month_keys
+        position = keys.searchsorted(key)
+        if position < keys.size and keys[position] == key:
+            return float(self._month_values[position])
+        raise CPIObjectDoesNotExist(
+            f"Index of monthly type for {date(month.year, month.month, 1)} does not exist"
+        )
+
+    def get_monthly_values(self, months):
+        """
+        Returns monthly CPI values for an array of months as a NumPy array.
+        """
+        if self._month_keys is None:
+            self._build_tables()
+        months = np.asarray(months, dtype="datetime64[M]")
+        keys = self._month_keys
+        positions = np.searchsorted(keys, months)
+        found = positions < keys.size
+        positions = np.where(found, positions, 0)
+        if keys.size:
+            found &= keys[positions] == months
+        else:
+            found = np.zeros(months.shape, dtype=bool)
+        if not found.all():
+            bad_month = months[(~found).argmax()].astype(object)
+            raise CPIObjectDoesNotExist(
+                f"Index of monthly type for {bad_month} does not exist"
+            )
+        return self._month_values[positions]
 
     def get_index_by_date(self, date, period_type="annual"):
         try:
@@ -321,11 +601,16 @@ class Index(BaseObject):
     A Consumer Price Index value generated by the Bureau of Labor Statistics.
     """
 
+    __slots__ = ("series", "year", "period", "value", "date")
+
     def __init__(self, series, year, period, value):
         self.series = series
         self.year = year
         self.period = period
         self.value = value
+        # Built once here rather than allocated on every .date read —
+        # the parse dedupe, bounds scans and serializers all hit it.
+        self.date = date(year, period.month, 1)
 
     def __str__(self):
         return f"{self.date} ({self.period}): {self.value}"
@@ -338,18 +623,11 @@ class Index(BaseObject):
             and self.period == other.period
         )
 
-    def __dict__(self):
+    def to_dict(self):
         return {
-            "series": self.series.__dict__(),
+            "series": self.series.to_dict(),
             "year": self.year,
             "date": str(self.date),
-            "period": self.period.__dict__(),
+            "period": self.period.to_dict(),
             "value": self.value,
         }
-
-    @property
-    def date(self):
-        """
-        Accepts a row from the raw BLS data. Returns a Python date object based on its period.
-        """
-        return date(self.year, self.period.month, 1)
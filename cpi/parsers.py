@@ -2,9 +2,17 @@
 """
 Parse and prepare the Consumer Price Index (CPI) dataset.
 """
+import atexit
+import functools
 import logging
 import os
 import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import numpy as np
 
 from .models import (
     Area,
@@ -23,27 +31,82 @@ logger.addHandler(logging.NullHandler())
 
 class BaseParser:
     THIS_DIR = os.path.dirname(__file__)
+    DB_PATH = os.path.join(THIS_DIR, "cpi.db")
 
-    def get_file(self, file):
+    # Each thread keeps one open connection rather than paying connection
+    # setup and schema parse for every table read.
+    _local = threading.local()
+
+    # Subclasses that parse a single metadata table configure these three
+    # attributes and inherit the generic loop below.
+    FILE = None
+    MODEL = None
+    FIELDS = None
+
+    @classmethod
+    def get_connection(cls):
+        """
+        Returns this thread's cached read-only connection to the database.
+        """
+        conn = getattr(cls._local, "conn", None)
+        if conn is None:
+            # Read-only mode also fails fast with a clear error if the
+            # database hasn't been downloaded, instead of creating an
+            # empty file. Worker-thread connections are only ever touched
+            # by their own thread, but atexit closes them from the main
+            # one, which requires lifting sqlite3's same-thread check.
+            conn = sqlite3.connect(
+                f"file:{cls.DB_PATH}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute("PRAGMA mmap_size=268435456")
+            cls._local.conn = conn
+            atexit.register(conn.close)
+        return conn
+
+    def parse(self):
         """
-        Returns the CPI data file provided as a list of dictionaries.
+        Returns a list of model objects parsed from the configured file.
         """
-        # Connect to database
-        db_path = os.path.join(self.THIS_DIR, "cpi.db")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        logger.debug(f"Parsing {self.FILE} file")
+        # The fields are known at code time, so fetch plain tuples in
+        # column order and unpack them straight into the model, building
+        # the collection in one bulk pass.
+        model = self.MODEL
+        return MappingList.from_iterable(
+            model(*row) for row in self.get_rows(self.FILE, self.FIELDS)
+        )
 
-        # Query this file
-        query = cursor.execute(f'SELECT * FROM "{file}"')
-        columns = [d[0] for d in query.description]
-        result_list = [dict(zip(columns, r)) for r in query.fetchall()]
+    def get_file(self, file):
+        """
+        Returns the rows of the provided CPI data file.
+
+        The cursor yields sqlite3.Row objects, which support the same
+        name-based access as dictionaries without allocating one per row,
+        and rows stream out of SQLite as the caller consumes them.
+        """
+        # Table names can't be bound as parameters, so refuse anything
+        # that isn't a plain BLS file name before it reaches the SQL.
+        if not file.replace(".", "").replace("_", "").isalnum():
+            raise ValueError(f"Invalid table name: {file}")
+        cursor = self.get_connection().cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor.execute(f'SELECT * FROM "{file}"')
 
-        # Close database connection
-        cursor.close()
-        cursor.connection.close()
+    def get_rows(self, file, fields):
+        """
+        Returns the requested columns of the provided CPI data file as tuples.
 
-        # Return data
-        return result_list
+        When the schema is known at code time there's no need for named
+        access, so this skips the sqlite3.Row wrapper and streams the bare
+        tuples SQLite already produces.
+        """
+        if not file.replace(".", "").replace("_", "").isalnum():
+            raise ValueError(f"Invalid table name: {file}")
+        if not all(f.isidentifier() for f in fields):
+            raise ValueError(f"Invalid column names: {fields}")
+        columns = ", ".join(f'"{f}"' for f in fields)
+        cursor = self.get_connection().cursor()
+        return cursor.execute(f'SELECT {columns} FROM "{file}"')
 
 
 class ParseArea(BaseParser):
@@ -51,16 +114,9 @@ class ParseArea(BaseParser):
     Parses the raw list of CPI areas.
     """
 
-    def parse(self):
-        """
-        Returns a list Area objects.
-        """
-        logger.debug("Parsing area file")
-        object_list = MappingList()
-        for row in self.get_file("cu.area"):
-            obj = Area(row["area_code"], row["area_name"])
-            object_list.append(obj)
-        return object_list
+    FILE = "cu.area"
+    MODEL = Area
+    FIELDS = ("area_code", "area_name")
 
 
 class ParseItem(BaseParser):
@@ -68,16 +124,9 @@ class ParseItem(BaseParser):
     Parses the raw list of CPI items.
     """
 
-    def parse(self):
-        """
-        Returns a list Area objects.
-        """
-        logger.debug("Parsing item file")
-        object_list = MappingList()
-        for row in self.get_file("cu.item"):
-            obj = Item(row["item_code"], row["item_name"])
-            object_list.append(obj)
-        return object_list
+    FILE = "cu.item"
+    MODEL = Item
+    FIELDS = ("item_code", "item_name")
 
 
 class ParsePeriod(BaseParser):
@@ -85,16 +134,9 @@ class ParsePeriod(BaseParser):
     Parses the raw list of CPI periods.
     """
 
-    def parse(self):
-        """
-        Returns a list Area objects.
-        """
-        logger.debug("Parsing period file")
-        object_list = MappingList()
-        for row in self.get_file("cu.period"):
-            obj = Period(row["period"], row["period_abbr"], row["period_name"])
-            object_list.append(obj)
-        return object_list
+    FILE = "cu.period"
+    MODEL = Period
+    FIELDS = ("period", "period_abbr", "period_name")
 
 
 class ParsePeriodicity(BaseParser):
@@ -102,16 +144,34 @@ class ParsePeriodicity(BaseParser):
     Parses the raw list of CPI periodicities.
     """
 
-    def parse(self):
-        """
-        Returns a list Periodicity objects.
-        """
-        logger.debug("Parsing periodicity file")
-        object_list = MappingList()
-        for row in self.get_file("cu.periodicity"):
-            obj = Periodicity(row["periodicity_code"], row["periodicity_name"])
-            object_list.append(obj)
-        return object_list
+    FILE = "cu.periodicity"
+    MODEL = Periodicity
+    FIELDS = ("periodicity_code", "periodicity_name")
+
+
+def parse_defaults():
+    """
+    Returns the area, item, period and periodicity lists in that order.
+
+    The four tables are independent reads over separate thread-local
+    connections, so a small pool overlaps them. Results are memoized the
+    same way as the one-at-a-time fallbacks below.
+    """
+    classes = (ParseArea, ParseItem, ParsePeriod, ParsePeriodicity)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        return tuple(pool.map(_parse_default, classes))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_default(parser_class):
+    """
+    Returns the parsed list for the provided parser class, built at most once.
+
+    ParseSeries falls back to these when no prebuilt mappings are passed in,
+    so repeated bare constructions share one SQLite walk per table instead
+    of rebuilding the same object lists from scratch.
+    """
+    return parser_class().parse()
 
 
 class ParseSeries(BaseParser):
@@ -148,23 +208,26 @@ class ParseSeries(BaseParser):
     ]
 
     def __init__(self, periods=None, periodicities=None, areas=None, items=None):
-        self.periods = periods or ParsePeriod().parse()
-        self.periodicities = periodicities or ParsePeriodicity().parse()
-        self.areas = areas or ParseArea().parse()
-        self.items = items or ParseItem().parse()
+        self.periods = periods or _parse_default(ParsePeriod)
+        self.periodicities = periodicities or _parse_default(ParsePeriodicity)
+        self.areas = areas or _parse_default(ParseArea)
+        self.items = items or _parse_default(ParseItem)
 
     def parse_id(self, id):
-        return dict(
-            survey_code=id[:2],
-            seasonal_code=id[2:3],
-            periodicity_code=id[3:4],
-            area_code=id[4:8],
-            item_code=id[8:],
-        )
+        """
+        Returns the parsed components of the provided series id as a tuple.
+
+        The order is survey, seasonality, periodicity, area and item code.
+        """
+        return (id[:2], id[2:3], id[3:4], id[4:8], id[8:])
 
     def parse(self):
         self.series_list = self.parse_series()
         self.parse_indexes()
+        # Sort once here so every later bounds lookup is O(1) instead of
+        # a full scan.
+        for series in self.series_list:
+            series._sort_indexes()
         return self.series_list
 
     def parse_series(self):
@@ -175,41 +238,102 @@ class ParseSeries(BaseParser):
         object_list = SeriesList(
             periodicities=self.periodicities, areas=self.areas, items=self.items
         )
+        # Bind the per-row lookups once outside the loop.
+        surveys = self.SURVEYS
+        parse_id = self.parse_id
+        get_periodicity = self.periodicities.get_by_id
+        get_area = self.areas.get_by_id
+        get_item = self.items.get_by_id
+        append = object_list.append
         for row in self.get_file("cu.series"):
-            parsed_id = self.parse_id(row["series_id"])
-            obj = Series(
-                row["series_id"],
-                row["series_title"],
-                self.SURVEYS[parsed_id["survey_code"]],
-                row["seasonal"] == "S",
-                self.periodicities.get_by_id(row["periodicity_code"]),
-                self.areas.get_by_id(row["area_code"]),
-                self.items.get_by_id(row["item_code"]),
+            survey_code, _, _, _, _ = parse_id(row["series_id"])
+            append(
+                Series(
+                    row["series_id"],
+                    row["series_title"],
+                    surveys[survey_code],
+                    row["seasonal"] == "S",
+                    get_periodicity(row["periodicity_code"]),
+                    get_area(row["area_code"]),
+                    get_item(row["item_code"]),
+                )
             )
-            object_list.append(obj)
         return object_list
 
     def parse_indexes(self):
         logger.debug("Parsing index files")
-        # Loop through all the files ...
-        for file in self.FILE_LIST:
-            # ... and for each file ...
-            for row in self.get_file(file):
-                # Get the series
-                series = self.series_list.get_by_id(row["series_id"])
-
-                # Create an object
-                index = Index(
-                    series,
-                    int(row["year"]),
-                    self.periods.get_by_id(row["period"]),
-                    float(row["value"]),
-                )
+        # Prefer the typed NumPy archive written by the downloader. It holds
+        # the same rows as the data tables but loads without any SQL walk.
+        npz_path = os.path.join(self.THIS_DIR, "cpi.npz")
+        if os.path.exists(npz_path):
+            archive = np.load(npz_path)
+            rows = zip(
+                archive["series_id"].tolist(),
+                archive["year"].tolist(),
+                archive["period"].tolist(),
+                archive["value"].tolist(),
+            )
+            self._add_rows(rows)
+            return
+
+        # Otherwise read all the files, letting SQLite do the type
+        # conversions in C instead of calling int() and float() on every
+        # row up here. A small pool fetches the next tables while this
+        # thread builds objects from the current one; each worker reads
+        # over its own thread-local connection. Submissions stay bounded
+        # so only a few tables of rows are ever buffered at once.
+        def fetch(file):
+            if not file.replace(".", "").replace("_", "").isalnum():
+                raise ValueError(f"Invalid table name: {file}")
+            cursor = self.get_connection().cursor()
+            return cursor.execute(
+                "SELECT series_id, CAST(year AS INTEGER), period, "
+                f'CAST(value AS REAL) FROM "{file}"'
+            ).fetchall()
+
+        files = iter(self.FILE_LIST)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = deque(pool.submit(fetch, f) for f in islice(files, 3))
+            while pending:
+                rows = pending.popleft().result()
+                next_file = next(files, None)
+                if next_file is not None:
+                    pending.append(pool.submit(fetch, next_file))
+                self._add_rows(rows)
+
+    def _add_rows(self, rows):
+        """
+        Adds the provided (series_id, year, period, value) rows to their series.
+        """
+        get_series = self.series_list.get_by_id
+        get_period = self.periods.get_by_id
+        # There are only a handful of period codes, and the data files keep
+        # each series' rows contiguous, so both resolutions are memoized
+        # rather than paid per row.
+        period_cache: dict = {}
+        last_id = None
+        series = None
+        for series_id, year, period_code, value in rows:
+            if series_id != last_id:
+                series = get_series(series_id)
+                last_id = series_id
+            period = period_cache.get(period_code)
+            if period is None:
+                period = get_period(period_code)
+                period_cache[period_code] = period
+
+            # Create an object
+            index = Index(series, year, period, value)
+
+            # Resolve the bucket and key once. Hashing the date and walking
+            # `index.period.type` repeatedly added up across millions of rows.
+            bucket = series._indexes[period.type]
+            existing = bucket.get(index.date)
 
-                # If the value has already been loaded ...
-                if index.date in series._indexes[index.period.type]:
-                    # ... verify this value matches what we have ...
-                    assert index == series._indexes[index.period.type][index.date]
-                else:
-                    # ... and if the series doesn't have the index yet, add it.
-                    series._indexes[index.period.type][index.date] = index
+            # If the value has already been loaded ...
+            if existing is not None:
+                # ... verify this value matches what we have ...
+                assert index == existing
+            else:
+                # ... and if the series doesn't have the index yet, add it.
+                bucket[index.date] = index
@@ -1,12 +1,6 @@
-import pandas as pd
-
 import cpi
 
-pd.DataFrame([o.__dict__() for o in cpi.areas]).to_csv("./data/areas.csv", index=False)
-pd.DataFrame([o.__dict__() for o in cpi.items]).to_csv("./data/items.csv", index=False)
-pd.DataFrame([o.__dict__() for o in cpi.periods]).to_csv(
-    "./data/periods.csv", index=False
-)
-pd.DataFrame([o.__dict__() for o in cpi.periodicities]).to_csv(
-    "./data/periodicities.csv", index=False
-)
+cpi.areas.to_dataframe().to_csv("./data/areas.csv", index=False)
+cpi.items.to_dataframe().to_csv("./data/items.csv", index=False)
+cpi.periods.to_dataframe().to_csv("./data/periods.csv", index=False)
+cpi.periodicities.to_dataframe().to_csv("./data/periodicities.csv", index=False)
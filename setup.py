@@ -62,6 +62,7 @@ setup(
         "requests",
         "click",
         "python-dateutil",
+        "numpy",
         "pandas",
     ),
     entry_points="""
@@ -17,6 +17,8 @@ class BaseCPITest(unittest.TestCase):
     These global variables change with each data update.
     """
 
+    EARLIEST_YEAR = 1913
+    EARLIEST_MONTH = date(1913, 1, 1)
     LATEST_YEAR = 2023
     LATEST_YEAR_1950_ALL_ITEMS = 1264.323651452282
     LATEST_YEAR_1950_CUSR0000SA0 = 1264.323651452282
@@ -32,6 +34,12 @@ class CPITest(BaseCPITest):
     def test_latest_month(self):
         self.assertEqual(cpi.LATEST_MONTH, self.LATEST_MONTH)
 
+    def test_earliest_year(self):
+        self.assertEqual(cpi.EARLIEST_YEAR, self.EARLIEST_YEAR)
+
+    def test_earliest_month(self):
+        self.assertEqual(cpi.EARLIEST_MONTH, self.EARLIEST_MONTH)
+
     def test_get(self):
         self.assertEqual(cpi.get(1950), 24.1)
         self.assertEqual(cpi.get(date(1950, 1, 1)), 23.5)
@@ -96,10 +104,10 @@ class CPITest(BaseCPITest):
             series.latest_month
             series.latest_year
             series.__str__()
-            series.__dict__()
+            series.to_dict()
             for index in series.indexes:
                 index.__str__()
-                index.__dict__()
+                index.to_dict()
 
     def test_get_errors(self):
         with self.assertRaises(CPIObjectDoesNotExist):
@@ -116,31 +124,40 @@ class CPITest(BaseCPITest):
             cpi.get(3000)
 
     def test_inflate_years(self):
-        self.assertEqual(cpi.inflate(100, 1950), self.LATEST_YEAR_1950_ALL_ITEMS)
-        self.assertEqual(
-            cpi.inflate(100, 1950, series_id="CUUR0000SA0"),
-            self.LATEST_YEAR_1950_CUSR0000SA0,
-        )
-        self.assertEqual(cpi.inflate(100, 1950, to=2017), 1017.0954356846472)
-        self.assertEqual(cpi.inflate(100, 1950, to=1960), 122.82157676348547)
-        self.assertEqual(cpi.inflate(100.0, 1950, to=1950), 100)
+        cases = [
+            ((100, 1950), {}, self.LATEST_YEAR_1950_ALL_ITEMS),
+            (
+                (100, 1950),
+                {"series_id": "CUUR0000SA0"},
+                self.LATEST_YEAR_1950_CUSR0000SA0,
+            ),
+            ((100, 1950), {"to": 2017}, 1017.0954356846472),
+            ((100, 1950), {"to": 1960}, 122.82157676348547),
+            ((100.0, 1950), {"to": 1950}, 100),
+        ]
+        for args, kwargs, expected in cases:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(cpi.inflate(*args, **kwargs), expected)
 
     def test_inflate_months(self):
-        self.assertEqual(
-            cpi.inflate(100, date(1950, 1, 1)), self.LATEST_MONTH_1950_ALL_ITEMS
-        )
-        self.assertEqual(
-            cpi.inflate(100, date(1950, 1, 11)), self.LATEST_MONTH_1950_ALL_ITEMS
-        )
-        self.assertEqual(
-            cpi.inflate(100, datetime(1950, 1, 1)), self.LATEST_MONTH_1950_ALL_ITEMS
-        )
-        self.assertEqual(
-            cpi.inflate(100, date(1950, 1, 1), to=date(2018, 1, 1)), 1054.7531914893618
-        )
-        self.assertEqual(
-            cpi.inflate(100, date(1950, 1, 1), to=date(1960, 1, 1)), 124.68085106382979
-        )
+        cases = [
+            ((100, date(1950, 1, 1)), {}, self.LATEST_MONTH_1950_ALL_ITEMS),
+            ((100, date(1950, 1, 11)), {}, self.LATEST_MONTH_1950_ALL_ITEMS),
+            ((100, datetime(1950, 1, 1)), {}, self.LATEST_MONTH_1950_ALL_ITEMS),
+            (
+                (100, date(1950, 1, 1)),
+                {"to": date(2018, 1, 1)},
+                1054.7531914893618,
+            ),
+            (
+                (100, date(1950, 1, 1)),
+                {"to": date(1960, 1, 1)},
+                124.68085106382979,
+            ),
+        ]
+        for args, kwargs, expected in cases:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(cpi.inflate(*args, **kwargs), expected)
 
     def test_inflate_other_series(self):
         self.assertEqual(
@@ -148,6 +165,26 @@ class CPITest(BaseCPITest):
             self.LATEST_MONTH_1950_CUSR0000SA0,
         )
 
+    def test_inflate_array(self):
+        values = [100, 200, 300]
+        years = [1950, 1960, 2000]
+        adjusted = cpi.inflate_array(values, years)
+        for value, year, expected in zip(values, years, adjusted):
+            self.assertEqual(cpi.inflate(value, year), expected)
+        adjusted = cpi.inflate_array(values, years, to=2017)
+        for value, year, expected in zip(values, years, adjusted):
+            self.assertEqual(cpi.inflate(value, year, to=2017), expected)
+
+        months = [date(1950, 1, 1), date(1960, 1, 1)]
+        adjusted = cpi.inflate_array([100, 100], months)
+        for value, month, expected in zip([100, 100], months, adjusted):
+            self.assertEqual(cpi.inflate(value, month), expected)
+
+        with self.assertRaises(CPIObjectDoesNotExist):
+            cpi.inflate_array([100], [1900])
+        with self.assertRaises(TypeError):
+            cpi.inflate_array([100], [1950], to=date(2000, 1, 1))
+
     def test_deflate(self):
         self.assertEqual(cpi.inflate(1017.0954356846472, 2017, to=1950), 100)
         self.assertEqual(cpi.inflate(122.82157676348547, 1960, to=1950), 100)
@@ -188,9 +225,9 @@ class CPITest(BaseCPITest):
 
     def test_pandas(self):
         df = pd.read_csv("test.csv")
-        df["ADJUSTED"] = df.apply(
-            lambda x: cpi.inflate(x.MEDIAN_HOUSEHOLD_INCOME, x.YEAR), axis=1
-        )
+        # The vectorized path adjusts the whole column in one pass and
+        # matches the scalar result exactly, as the assertion below checks.
+        df["ADJUSTED"] = cpi.inflate_array(df.MEDIAN_HOUSEHOLD_INCOME, df.YEAR)
         df = df.set_index("YEAR")
         self.assertEqual(
             cpi.inflate(df.at[1984, "MEDIAN_HOUSEHOLD_INCOME"], 1984),
@@ -242,6 +279,17 @@ class CliTest(BaseCPITest):
             str(round(self.LATEST_MONTH_1950_CUSR0000SA0, 7)),
         )
 
+    def test_inflate_file(self):
+        expected = cpi.inflate_array([100.0, 200.0], [1950, 1960])
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("batch.csv", "w") as fp:
+                fp.write("100,1950\n200,1960\n")
+            result = runner.invoke(cli.inflate, ["--file", "batch.csv"])
+        self.assertEqual(result.exit_code, 0)
+        adjusted = [float(line) for line in result.output.strip().split("\n")]
+        self.assertEqual(adjusted, list(expected))
+
 
 if __name__ == "__main__":
     unittest.main()